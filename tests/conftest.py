@@ -0,0 +1,118 @@
+"""Shared fixtures: a fake HTPC serving LibreHardwareMonitor and agent endpoints."""
+
+import asyncio
+import json
+import socket
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+import uc_intg_htpc.config
+from uc_intg_htpc.client import HTCPClient
+from uc_intg_htpc.config import HTCPConfig
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def sensor(text: str, value: str) -> dict:
+    return {"Text": text, "Value": value, "Children": []}
+
+
+def group(text: str, *sensors: dict) -> dict:
+    return {"Text": text, "Children": list(sensors)}
+
+
+def hardware(text: str, hardware_id: str, *children: dict) -> dict:
+    return {"Text": text, "HardwareId": hardware_id, "Children": list(children)}
+
+
+def lhm_tree(*components: dict) -> dict:
+    return {"Text": "Sensor", "Children": [{"Text": "HTPC", "Children": list(components)}]}
+
+
+def cpu(temp: str = "61.3 °C", load: str = "12.5 %") -> dict:
+    return hardware(
+        "AMD Ryzen 7 5800X",
+        "/amdcpu/0",
+        group("Temperatures", sensor("Core (Tctl/Tdie)", temp)),
+        group("Load", sensor("CPU Total", load)),
+    )
+
+
+class FakeHTPC:
+    """LHM data.json plus the agent's /health and /command on one local port."""
+
+    def __init__(self) -> None:
+        self.port = 0
+        self.data_status = 200
+        self.data_body: bytes = json.dumps(lhm_tree(cpu())).encode()
+        self.etag: str | None = None
+        self.data_delay = 0.0
+        self.data_requests: list[dict[str, str]] = []
+        self.health_status = 200
+        self.commands: list[str] = []
+        # When set, set_volume: commands are held until the event fires
+        self.volume_gate: asyncio.Event | None = None
+
+    def set_tree(self, tree: dict) -> None:
+        self.data_body = json.dumps(tree).encode()
+
+    async def _data(self, request: web.Request) -> web.StreamResponse:
+        self.data_requests.append(dict(request.headers))
+        if self.data_delay:
+            await asyncio.sleep(self.data_delay)
+        if self.etag and request.headers.get("If-None-Match") == self.etag:
+            return web.Response(status=304)
+        headers = {"ETag": self.etag} if self.etag else None
+        return web.Response(status=self.data_status, body=self.data_body, headers=headers)
+
+    async def _health(self, request: web.Request) -> web.Response:
+        return web.Response(status=self.health_status)
+
+    async def _command(self, request: web.Request) -> web.Response:
+        command = (await request.json())["command"]
+        self.commands.append(command)
+        if self.volume_gate is not None and command.startswith("set_volume:"):
+            await self.volume_gate.wait()
+        return web.json_response({"success": True})
+
+    def config(self, **kwargs) -> HTCPConfig:
+        return HTCPConfig(identifier="htpc_test", name="HTPC", host="127.0.0.1", port=self.port, **kwargs)
+
+
+@pytest_asyncio.fixture
+async def htpc(monkeypatch: pytest.MonkeyPatch):
+    fake = FakeHTPC()
+    app = web.Application()
+    app.router.add_get("/data.json", fake._data)
+    app.router.add_get("/health", fake._health)
+    app.router.add_post("/command", fake._command)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    fake.port = free_port()
+    site = web.TCPSite(runner, "127.0.0.1", fake.port)
+    await site.start()
+    # The agent normally listens on its own fixed port; point it at the fake server
+    monkeypatch.setattr(uc_intg_htpc.config, "AGENT_PORT", fake.port)
+    yield fake
+    if fake.volume_gate is not None:
+        fake.volume_gate.set()
+    await runner.cleanup()
+
+
+@pytest.fixture
+def unreachable_config(monkeypatch: pytest.MonkeyPatch) -> HTCPConfig:
+    port = free_port()
+    monkeypatch.setattr(uc_intg_htpc.config, "AGENT_PORT", port)
+    return HTCPConfig(identifier="htpc_test", name="HTPC", host="127.0.0.1", port=port)
+
+
+@pytest.fixture
+def no_fetch_coalescing(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Back-to-back polls in a test would otherwise share one fetch
+    monkeypatch.setattr(HTCPClient, "FETCH_MAX_AGE", 0)
@@ -0,0 +1,185 @@
+"""Tests for the HTPC client."""
+
+import asyncio
+
+import pytest
+
+from conftest import cpu, group, hardware, lhm_tree, sensor
+from uc_intg_htpc.client import HTCPClient
+
+
+async def _wait_for(predicate) -> None:
+    for _ in range(200):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+@pytest.mark.asyncio
+async def test_volume_burst_posts_only_the_last_value(htpc):
+    client = HTCPClient(htpc.config())
+    try:
+        results = await asyncio.gather(*(client.send_command(f"set_volume:{level}") for level in range(10, 60, 10)))
+        assert results == [True] * 5
+        assert htpc.commands == ["set_volume:50"]
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_volume_changes_during_a_post_collapse_to_the_latest(htpc):
+    htpc.volume_gate = asyncio.Event()
+    client = HTCPClient(htpc.config())
+    try:
+        first = asyncio.create_task(client.send_command("set_volume:10"))
+        await _wait_for(lambda: htpc.commands)
+        later = [asyncio.create_task(client.send_command(f"set_volume:{level}")) for level in (20, 30, 40)]
+        await asyncio.sleep(0.05)
+        htpc.volume_gate.set()
+        assert await asyncio.gather(first, *later) == [True] * 4
+        assert htpc.commands == ["set_volume:10", "set_volume:40"]
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_other_commands_are_not_held_behind_volume(htpc):
+    htpc.volume_gate = asyncio.Event()
+    client = HTCPClient(htpc.config())
+    try:
+        volume = asyncio.create_task(client.send_command("set_volume:10"))
+        await _wait_for(lambda: htpc.commands)
+        assert await asyncio.wait_for(client.send_command("play_pause"), 1) is True
+        assert not volume.done()
+        htpc.volume_gate.set()
+        assert await volume is True
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_volume_caller_does_not_drop_the_next_value(htpc):
+    htpc.volume_gate = asyncio.Event()
+    client = HTCPClient(htpc.config())
+    try:
+        first = asyncio.create_task(client.send_command("set_volume:10"))
+        await _wait_for(lambda: htpc.commands)
+        second = asyncio.create_task(client.send_command("set_volume:20"))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        htpc.volume_gate.set()
+        assert await second is True
+        assert htpc.commands == ["set_volume:10", "set_volume:20"]
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_late_super_io_chip_is_picked_up(htpc, no_fetch_coalescing):
+    lpc = hardware(
+        "Nuvoton NCT6798D",
+        "/lpc/nct6798d/0",
+        group("Temperatures", sensor("SYSTIN", "50.7 °C")),
+        group("Fans", sensor("Fan #1", "850 RPM")),
+    )
+    client = HTCPClient(htpc.config())
+    try:
+        htpc.set_tree(lhm_tree(hardware("ASUS ROG", "/motherboard")))
+        assert await client.update_system_data()
+        assert client.system_data.motherboard_temp_avg is None
+
+        htpc.set_tree(lhm_tree(hardware("ASUS ROG", "/motherboard", lpc)))
+        assert await client.update_system_data()
+        assert client.system_data.motherboard_temp_avg == pytest.approx(50.7)
+        assert client.system_data.fan_speeds == [850.0]
+    finally:
+        await client.close()
+
+
+@pytest.mark.parametrize(
+    ("reading", "expected"),
+    [
+        ("61.3 °C", 61.3),
+        ("45,5 °C", 45.5),
+        ("  12.5 °C", 12.5),
+        ("-3.5 °C", -3.5),
+        (".5 °C", 0.5),
+        ("1e3 °C", 1000.0),
+        ("1E+2 °C", 100.0),
+        ("1,5e1 °C", 15.0),
+        ("1,234.5 °C", None),
+        ("1.2.3 °C", None),
+        ("50°C", None),
+        ("n/a", None),
+    ],
+)
+@pytest.mark.asyncio
+async def test_sensor_values_parse_like_the_first_token_as_float(htpc, reading, expected):
+    htpc.set_tree(lhm_tree(cpu(temp=reading)))
+    client = HTCPClient(htpc.config())
+    try:
+        assert await client.update_system_data()
+        assert client.system_data.cpu_temp == (pytest.approx(expected) if expected is not None else None)
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_revision_advances_only_when_the_payload_changes(htpc, no_fetch_coalescing):
+    client = HTCPClient(htpc.config())
+    try:
+        assert await client.update_system_data()
+        first = client.system_data.revision
+
+        assert await client.update_system_data()
+        assert client.system_data.revision == first
+
+        htpc.set_tree(lhm_tree(cpu(temp="70.0 °C")))
+        assert await client.update_system_data()
+        assert client.system_data.revision > first
+        assert client.system_data.cpu_temp == pytest.approx(70.0)
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_not_modified_counts_as_success(htpc, no_fetch_coalescing):
+    htpc.etag = '"v1"'
+    client = HTCPClient(htpc.config())
+    try:
+        assert await client.update_system_data()
+        revision = client.system_data.revision
+        updated = client.system_data.last_updated
+
+        assert await client.update_system_data()
+        assert htpc.data_requests[-1].get("If-None-Match") == '"v1"'
+        assert client.system_data.revision == revision
+        assert client.system_data.last_updated >= updated
+        assert client.system_data.cpu_temp == pytest.approx(61.3)
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_forgets_the_etag(htpc, no_fetch_coalescing):
+    htpc.etag = '"v1"'
+    client = HTCPClient(htpc.config())
+    try:
+        assert await client.update_system_data()
+        revision = client.system_data.revision
+
+        htpc.etag = '"v2"'
+        htpc.data_body = b'{"Children": ['
+        assert not await client.update_system_data()
+
+        # Same ETag, now with a good body: a conditional request would be answered 304 and keep the old data
+        htpc.set_tree(lhm_tree(cpu(temp="70.0 °C")))
+        assert await client.update_system_data()
+        assert "If-None-Match" not in htpc.data_requests[-1]
+        assert client.system_data.revision > revision
+        assert client.system_data.cpu_temp == pytest.approx(70.0)
+    finally:
+        await client.close()
@@ -0,0 +1,72 @@
+"""Tests for config.json persistence."""
+
+import json
+import os
+from dataclasses import fields
+
+import pytest
+
+from uc_intg_htpc.config import HTCPConfig, HTCPConfigManager
+
+
+def _manager(path) -> HTCPConfigManager:
+    return HTCPConfigManager(str(path), config_class=HTCPConfig)
+
+
+def _config(**kwargs) -> HTCPConfig:
+    values = {"identifier": "htpc_1", "name": "Living Room", "host": "192.168.1.20"}
+    values.update(kwargs)
+    return HTCPConfig(**values)
+
+
+def test_store_and_load_round_trip(tmp_path):
+    original = _config(port=9000, temperature_unit="fahrenheit", mac_address="aa:bb:cc:dd:ee:ff")
+    _manager(tmp_path).add_or_update(original)
+
+    stored = json.loads((tmp_path / "config.json").read_text(encoding="utf-8"))
+    assert [set(item) for item in stored] == [{f.name for f in fields(HTCPConfig)}]
+
+    loaded = _manager(tmp_path)
+    assert loaded.device_count == 1
+    device = loaded.get("htpc_1")
+    assert device == original
+    assert device.data_url == "http://192.168.1.20:9000/data.json"
+    assert device.format_temperature(100.0) == "212.0°F"
+
+
+def test_missing_file_starts_empty(tmp_path):
+    manager = _manager(tmp_path)
+    assert manager.device_count == 0
+    assert manager.load() is False
+
+
+def test_corrupt_file_is_rejected(tmp_path):
+    (tmp_path / "config.json").write_bytes(b'[{"identifier": "htpc_1",')
+    manager = _manager(tmp_path)
+    assert manager.device_count == 0
+    assert manager.load() is False
+
+
+def test_interrupted_write_keeps_the_previous_file(tmp_path, monkeypatch):
+    manager = _manager(tmp_path)
+    manager.add_or_update(_config())
+    before = (tmp_path / "config.json").read_bytes()
+
+    def fail_fsync(fd: int) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "fsync", fail_fsync)
+    manager.add_or_update(_config(name="Renamed"))
+
+    assert manager.store() is False
+    assert (tmp_path / "config.json").read_bytes() == before
+    monkeypatch.undo()
+    assert _manager(tmp_path).get("htpc_1").name == "Living Room"
+
+
+@pytest.mark.parametrize("payload", [b"{}", b'"text"', b'["htpc_1"]'])
+def test_unexpected_shape_is_rejected(tmp_path, payload):
+    (tmp_path / "config.json").write_bytes(payload)
+    manager = _manager(tmp_path)
+    assert manager.device_count == 0
+    assert manager.load() is False
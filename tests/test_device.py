@@ -0,0 +1,72 @@
+"""Tests for the HTPC polling device."""
+
+import asyncio
+import logging
+from types import SimpleNamespace
+
+import pytest
+from ucapi.entities import Entities
+from ucapi_framework.device import DeviceEvents
+
+import uc_intg_htpc.device
+from uc_intg_htpc.client import HTCPClient
+from uc_intg_htpc.device import MAX_CONSECUTIVE_FAILURES, HTCPDevice
+
+
+def _device(config) -> HTCPDevice:
+    # A driver whose Remote has none of this device's reading entities configured
+    driver = SimpleNamespace(api=SimpleNamespace(configured_entities=Entities("configured", asyncio.get_running_loop())))
+    device = HTCPDevice(config, driver=driver)
+    device.register_reading_entity(f"media_player.{config.identifier}")
+    return device
+
+
+async def _connected(config) -> HTCPDevice:
+    device = _device(config)
+    device._client = HTCPClient(config)
+    device._state = "ON"
+    return device
+
+
+@pytest.mark.asyncio
+async def test_unwatched_device_still_goes_unavailable(unreachable_config, monkeypatch):
+    monkeypatch.setattr(uc_intg_htpc.device, "UNWATCHED_FETCH_INTERVAL", 0)
+    device = await _connected(unreachable_config)
+    updates = []
+    device.events.on(DeviceEvents.UPDATE, lambda *args: updates.append(args))
+    try:
+        for _ in range(MAX_CONSECUTIVE_FAILURES):
+            await device.poll_device()
+        assert device.state == "UNAVAILABLE"
+        assert updates
+    finally:
+        await device.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_unwatched_device_fetches_at_the_slow_rate(htpc):
+    device = await _connected(htpc.config())
+    try:
+        for _ in range(3):
+            await device.poll_device()
+        assert len(htpc.data_requests) == 1
+        assert device.state == "ON"
+    finally:
+        await device.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_icon_lookup_never_reads_from_disk(unreachable_config, monkeypatch, caplog):
+    monkeypatch.setattr(uc_intg_htpc.device, "_ICON_CACHE", {})
+    monkeypatch.setattr(uc_intg_htpc.device, "_ICON_MISSES", set())
+    device = _device(unreachable_config)
+
+    with caplog.at_level(logging.WARNING, logger="uc_intg_htpc.device"):
+        assert device.get_icon_base64("cpu_monitor.png") == ""
+        assert device.get_icon_base64("cpu_monitor.png") == ""
+    assert len(caplog.records) == 1
+    assert uc_intg_htpc.device._ICON_CACHE == {}
+
+    await device.load_icons(["cpu_monitor.png", "no_such_icon.png"])
+    assert device.get_icon_base64("cpu_monitor.png").startswith("data:image/png;base64,")
+    assert device.get_icon_base64("no_such_icon.png") == device.get_icon_base64("system_overview.png") != ""
@@ -0,0 +1,93 @@
+"""Tests for the monitoring media player's state sync."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from ucapi import media_player
+from ucapi.entities import Entities
+
+from uc_intg_htpc.client import SystemData
+from uc_intg_htpc.config import HTCPConfig
+from uc_intg_htpc.device import HTCPDevice
+from uc_intg_htpc.media_player import HTCPMediaPlayer
+
+_IMAGE = media_player.Attributes.MEDIA_IMAGE_URL
+
+
+def _readings(revision: int, cpu_temp: float = 61.3) -> SystemData:
+    return SystemData(cpu_temp=cpu_temp, cpu_load=12.5, revision=revision)
+
+
+def _player() -> tuple[HTCPDevice, HTCPMediaPlayer, list[dict]]:
+    configured = Entities("configured", asyncio.get_running_loop())
+    api = SimpleNamespace(configured_entities=configured)
+    config = HTCPConfig(identifier="htpc_test", name="HTPC", host="127.0.0.1")
+    device = HTCPDevice(config, driver=SimpleNamespace(api=api))
+    entity = HTCPMediaPlayer(config, device)
+    entity._api = api
+    configured.add(entity)
+    device._state = "ON"
+    device._system_data = _readings(revision=1)
+
+    # Record what sync_state hands over, before the framework drops unchanged values
+    sent: list[dict] = []
+    update = entity.update
+
+    def record(attributes, **kwargs):
+        sent.append(dict(attributes))
+        update(attributes, **kwargs)
+
+    entity.update = record
+    return device, entity, sent
+
+
+@pytest.mark.asyncio
+async def test_view_change_resends_the_image():
+    device, entity, sent = _player()
+    await entity.sync_state()
+    assert _IMAGE in sent[-1]
+    first_image = sent[-1][_IMAGE]
+
+    device._system_data = _readings(revision=2, cpu_temp=65.0)
+    await entity.sync_state()
+    assert _IMAGE not in sent[-1]
+
+    device.set_current_view("CPU Performance")
+    await entity.sync_state()
+    assert sent[-1][media_player.Attributes.SOURCE] == "CPU Performance"
+    assert sent[-1][_IMAGE] and sent[-1][_IMAGE] != first_image
+
+
+@pytest.mark.asyncio
+async def test_new_revision_with_the_same_readings_sends_nothing():
+    device, entity, sent = _player()
+    await entity.sync_state()
+    count = len(sent)
+
+    device._system_data = _readings(revision=2)
+    await entity.sync_state()
+    await entity.sync_state()
+    assert len(sent) == count
+
+
+@pytest.mark.asyncio
+async def test_temperature_unit_change_rerenders():
+    device, entity, sent = _player()
+    await entity.sync_state()
+    assert sent[-1][media_player.Attributes.MEDIA_TITLE] == "CPU: 61.3°C (12.5%)"
+
+    device.config.temperature_unit = "fahrenheit"
+    await entity.sync_state()
+    assert sent[-1][media_player.Attributes.MEDIA_TITLE] == "CPU: 142.3°F (12.5%)"
+
+
+@pytest.mark.asyncio
+async def test_source_list_is_not_resent():
+    device, entity, sent = _player()
+    await entity.sync_state()
+    device.set_current_view("Memory Usage")
+    device._system_data = _readings(revision=2, cpu_temp=65.0)
+    await entity.sync_state()
+    assert sent
+    assert all(media_player.Attributes.SOURCE_LIST not in attrs for attrs in sent)
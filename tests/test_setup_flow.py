@@ -0,0 +1,62 @@
+"""Tests for the setup flow's connection checks."""
+
+from functools import partial
+
+import aiohttp
+import pytest
+from ucapi import IntegrationSetupError, SetupError
+
+import uc_intg_htpc.setup_flow
+from uc_intg_htpc.client import HTCPClient
+from uc_intg_htpc.config import HTCPConfig, HTCPConfigManager
+from uc_intg_htpc.driver import HTCPDriver
+from uc_intg_htpc.setup_flow import HTCPSetupFlow
+
+
+def _flow(tmp_path, monkeypatch, port: int) -> HTCPSetupFlow:
+    # The form has no port field, so point the created config at the test server
+    monkeypatch.setattr(uc_intg_htpc.setup_flow, "HTCPConfig", partial(HTCPConfig, port=port))
+    driver = HTCPDriver()
+    return HTCPSetupFlow(HTCPConfigManager(str(tmp_path), config_class=HTCPConfig), driver=driver)
+
+
+_FORM = {"name": "HTPC", "host": "127.0.0.1", "enable_hardware_monitoring": "enabled"}
+
+
+@pytest.mark.asyncio
+async def test_reachable_htpc_returns_the_config(htpc, tmp_path, monkeypatch):
+    result = await _flow(tmp_path, monkeypatch, htpc.port).query_device(dict(_FORM))
+    assert isinstance(result, HTCPConfig)
+    assert result.host == "127.0.0.1"
+
+
+@pytest.mark.asyncio
+async def test_missing_data_json_is_not_found(htpc, tmp_path, monkeypatch):
+    htpc.data_status = 404
+    result = await _flow(tmp_path, monkeypatch, htpc.port).query_device(dict(_FORM))
+    assert isinstance(result, SetupError)
+    assert result.error_type == IntegrationSetupError.NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_refused_connection_is_connection_refused(unreachable_config, tmp_path, monkeypatch):
+    result = await _flow(tmp_path, monkeypatch, unreachable_config.port).query_device(dict(_FORM))
+    assert isinstance(result, SetupError)
+    assert result.error_type == IntegrationSetupError.CONNECTION_REFUSED
+
+
+@pytest.mark.asyncio
+async def test_slow_lhm_is_timeout(htpc, tmp_path, monkeypatch):
+    monkeypatch.setattr(HTCPClient, "LHM_PROBE_TIMEOUT", aiohttp.ClientTimeout(total=0.2))
+    htpc.data_delay = 1.0
+    result = await _flow(tmp_path, monkeypatch, htpc.port).query_device(dict(_FORM))
+    assert isinstance(result, SetupError)
+    assert result.error_type == IntegrationSetupError.TIMEOUT
+
+
+@pytest.mark.asyncio
+async def test_other_failures_are_other(htpc, tmp_path, monkeypatch):
+    htpc.data_status = 500
+    result = await _flow(tmp_path, monkeypatch, htpc.port).query_device(dict(_FORM))
+    assert isinstance(result, SetupError)
+    assert result.error_type == IntegrationSetupError.OTHER
@@ -9,12 +9,14 @@ import asyncio
 import json
 import logging
 import os
+import signal
+from contextlib import suppress
 from pathlib import Path
 
 from ucapi import DeviceStates
-from ucapi_framework import BaseConfigManager, get_config_path
+from ucapi_framework import get_config_path
 
-from uc_intg_htpc.config import HTCPConfig
+from uc_intg_htpc.config import HTCPConfig, HTCPConfigManager
 from uc_intg_htpc.driver import HTCPDriver
 from uc_intg_htpc.setup_flow import HTCPSetupFlow
 
@@ -30,10 +32,11 @@ _LOG = logging.getLogger(__name__)
 
 async def main():
     """Main entry point."""
-    level = os.getenv("UC_LOG_LEVEL", "DEBUG").upper()
+    level = os.getenv("UC_LOG_LEVEL", "INFO").upper()
     logging.basicConfig(
-        level=getattr(logging, level, logging.DEBUG),
+        level=getattr(logging, level, logging.INFO),
         format="%(asctime)s | %(levelname)-8s | %(name)-25s | %(message)s",
+        datefmt="%H:%M:%S",
     )
     logging.getLogger("aiohttp").setLevel(logging.WARNING)
     logging.getLogger("websockets.server").setLevel(logging.CRITICAL)
@@ -43,7 +46,7 @@ async def main():
     driver = HTCPDriver()
 
     config_path = get_config_path(driver.api.config_dir_path or "")
-    config_manager = BaseConfigManager(
+    config_manager = HTCPConfigManager(
         config_path,
         add_handler=driver.on_device_added,
         remove_handler=driver.on_device_removed,
@@ -57,7 +60,7 @@ async def main():
 
     await driver.register_all_device_instances(connect=False)
 
-    device_count = len(list(config_manager.all()))
+    device_count = config_manager.device_count
     if device_count > 0:
         await driver.api.set_device_state(DeviceStates.CONNECTED)
     else:
@@ -65,7 +68,14 @@ async def main():
 
     _LOG.info("Integration started - %d device(s) configured", device_count)
 
-    await asyncio.Future()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        with suppress(NotImplementedError):
+            loop.add_signal_handler(sig, stop.set)
+    await stop.wait()
+    _LOG.info("Shutting down HTPC System Monitor Integration")
+    await driver.shutdown()
 
 
 if __name__ == "__main__":
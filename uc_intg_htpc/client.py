@@ -6,45 +6,91 @@ LibreHardwareMonitor and HTPC Agent HTTP client.
 """
 
 import asyncio
+import hashlib
+import itertools
 import logging
 import re
 import time
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 import aiohttp
-from wakeonlan import send_magic_packet
+import orjson
+from ucapi import IntegrationSetupError
 
 from uc_intg_htpc.config import HTCPConfig
-from uc_intg_htpc.const import AGENT_PORT
 
 _LOG = logging.getLogger(__name__)
 
+_STORAGE_SIZE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(TB|GB)", re.IGNORECASE)
+# Leading number of a reading, as float() would take the first token: decimal comma, optional exponent, and
+# nothing glued on, so "1,234.5 MHz" is rejected rather than read as 1.234
+_SENSOR_VALUE_RE = re.compile(r"\s*([-+]?(?:\d+(?:[.,]\d*)?|[.,]\d+)(?:[eE][-+]?\d+)?)(?!\S)")
+# A "Value" holding anything besides whitespace; enough to count sensors without decoding the tree
+_SENSOR_COUNT_RE = re.compile(rb'"Value"\s*:\s*"\s*[^"\s]')
 
+# Shared across clients so a reconnect never reuses a revision a consumer has seen
+_REVISIONS = itertools.count(1)
+
+
+@lru_cache(maxsize=32)
+def _extract_size(name: str) -> float | None:
+    match = _STORAGE_SIZE_RE.search(name)
+    if match:
+        val = float(match.group(1))
+        if match.group(2).upper() == "TB":
+            val *= 1000
+        return val
+    return None
+
+
+@dataclass(slots=True)
 class SystemData:
     """Parsed hardware sensor data from LibreHardwareMonitor."""
 
-    def __init__(self) -> None:
-        self.cpu_temp: float | None = None
-        self.cpu_load: float | None = None
-        self.cpu_clock: float | None = None
-        self.cpu_power: float | None = None
-        self.gpu_temp: float | None = None
-        self.gpu_load: float | None = None
-        self.memory_used: float | None = None
-        self.memory_total: float | None = None
-        self.storage_used: float | None = None
-        self.storage_total: float | None = None
-        self.storage_used_percent: float | None = None
-        self.storage_temp: float | None = None
-        self.network_up: float | None = None
-        self.network_down: float | None = None
-        self.motherboard_temp_avg: float | None = None
-        self.motherboard_temp_max: float | None = None
-        self.fan_speeds: list[float] = []
-        self.has_dedicated_gpu: bool = False
-        self.detected_cpu_name: str = "CPU"
-        self.detected_gpu_name: str = "GPU"
-        self.last_updated: float = 0.0
+    cpu_temp: float | None = None
+    cpu_load: float | None = None
+    cpu_clock: float | None = None
+    cpu_power: float | None = None
+    gpu_temp: float | None = None
+    gpu_load: float | None = None
+    memory_used: float | None = None
+    memory_total: float | None = None
+    storage_used: float | None = None
+    storage_total: float | None = None
+    storage_used_percent: float | None = None
+    storage_temp: float | None = None
+    network_up: float | None = None
+    network_down: float | None = None
+    motherboard_temp_avg: float | None = None
+    motherboard_temp_max: float | None = None
+    fan_speeds: list[float] = field(default_factory=list)
+    has_dedicated_gpu: bool = False
+    detected_cpu_name: str = "CPU"
+    detected_gpu_name: str = "GPU"
+    last_updated: float = 0.0
+    revision: int = 0
+
+    def reset_measurements(self) -> None:
+        """Clear per-poll sensor readings, keeping detected hardware identity."""
+        self.cpu_temp = None
+        self.cpu_load = None
+        self.cpu_clock = None
+        self.cpu_power = None
+        self.gpu_temp = None
+        self.gpu_load = None
+        self.memory_used = None
+        self.memory_total = None
+        self.storage_used = None
+        self.storage_total = None
+        self.storage_used_percent = None
+        self.storage_temp = None
+        self.network_up = None
+        self.network_down = None
+        self.motherboard_temp_avg = None
+        self.motherboard_temp_max = None
+        self.fan_speeds = []
 
 
 class HTCPClient:
@@ -54,130 +100,204 @@ class HTCPClient:
         self._config = config
         self._session: aiohttp.ClientSession | None = None
         self._system_data = SystemData()
+        self._spare_data = SystemData()
         self._logged_structure: bool = False
+        self._sensor_index: dict[int, list[tuple[str, str, str]]] = {}
+        self._last_etag: str | None = None
+        self._last_digest: bytes | None = None
+        self._pending_volume: str | None = None
+        self._volume_sender: asyncio.Task | None = None
+        self._fetch_lock = asyncio.Lock()
+        self._fetched_at: float = 0.0
+        self._fetch_ok: bool = False
 
     @property
     def system_data(self) -> SystemData:
         return self._system_data
 
-    async def connect(self) -> bool:
-        if not self._session:
-            connector = aiohttp.TCPConnector(limit=3)
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        if not self._session or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=10,
+                limit_per_host=4,
+                keepalive_timeout=75,
+                ttl_dns_cache=60,
+                ssl=False,
+            )
             self._session = aiohttp.ClientSession(
                 timeout=aiohttp.ClientTimeout(total=10, connect=5),
                 connector=connector,
             )
+        return self._session
+
+    async def connect(self) -> bool:
+        self._ensure_session()
         if self._config.enable_hardware_monitoring:
             return await self.update_system_data()
         return await self.test_agent()
 
     async def close(self) -> None:
+        if self._volume_sender and not self._volume_sender.done():
+            self._volume_sender.cancel()
         if self._session:
             await self._session.close()
             self._session = None
 
     async def test_agent(self) -> bool:
-        session = self._session
-        close_after = False
-        if not session:
-            session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5))
-            close_after = True
+        session = self._ensure_session()
         try:
-            url = f"http://{self._config.host}:{AGENT_PORT}/health"
-            async with session.get(url) as resp:
+            url = f"{self._config.agent_url}/health"
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=5, sock_connect=2)) as resp:
                 return resp.status == 200
-        except Exception:
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as err:
+            _LOG.debug("Agent health check failed: %s", err)
             return False
-        finally:
-            if close_after:
-                await session.close()
+
+    # Setup probes fail fast on a dead host instead of sitting out the full total timeout
+    LHM_PROBE_TIMEOUT = aiohttp.ClientTimeout(total=10, sock_connect=2, sock_read=5)
 
     async def test_lhm(self) -> dict[str, Any]:
-        session = self._session
-        close_after = False
-        if not session:
-            session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
-            close_after = True
+        session = self._ensure_session()
         try:
-            url = f"http://{self._config.host}:{self._config.port}/data.json"
-            async with session.get(url) as resp:
+            async with session.get(self._config.data_url, timeout=self.LHM_PROBE_TIMEOUT) as resp:
                 if resp.status != 200:
-                    return {"success": False, "error": f"HTTP {resp.status}"}
-                data = await resp.json()
-                count = self._count_sensors(data)
-                return {"success": True, "sensor_count": count}
+                    code = IntegrationSetupError.NOT_FOUND if resp.status == 404 else IntegrationSetupError.OTHER
+                    return {"success": False, "error": f"HTTP {resp.status}", "error_code": code}
+                body = await resp.read()
+                if not body.lstrip().startswith(b"{"):
+                    return {
+                        "success": False,
+                        "error": "Unexpected response from LibreHardwareMonitor",
+                        "error_code": IntegrationSetupError.NOT_FOUND,
+                    }
+                return {"success": True, "sensor_count": len(_SENSOR_COUNT_RE.findall(body))}
         except aiohttp.ClientConnectorError:
-            return {"success": False, "error": f"Connection refused at {self._config.host}:{self._config.port}"}
+            return {
+                "success": False,
+                "error": f"Connection refused at {self._config.host}:{self._config.port}",
+                "error_code": IntegrationSetupError.CONNECTION_REFUSED,
+            }
+        except asyncio.TimeoutError:
+            return {"success": False, "error": "Timed out", "error_code": IntegrationSetupError.TIMEOUT}
         except Exception as err:
-            return {"success": False, "error": str(err)}
-        finally:
-            if close_after:
-                await session.close()
+            return {"success": False, "error": str(err), "error_code": IntegrationSetupError.OTHER}
+
+    # Callers arriving within this window share the previous fetch's result
+    FETCH_MAX_AGE = 0.5
 
     async def update_system_data(self) -> bool:
-        if not self._session:
-            return False
+        async with self._fetch_lock:
+            if time.monotonic() - self._fetched_at < self.FETCH_MAX_AGE:
+                return self._fetch_ok
+            self._fetch_ok = await self._fetch_system_data()
+            self._fetched_at = time.monotonic()
+            return self._fetch_ok
+
+    async def _fetch_system_data(self) -> bool:
+        session = self._ensure_session()
         try:
-            url = f"http://{self._config.host}:{self._config.port}/data.json"
-            async with self._session.get(url) as resp:
+            headers = {"If-None-Match": self._last_etag} if self._last_etag else None
+            async with session.get(self._config.data_url, headers=headers) as resp:
+                if resp.status == 304:
+                    self._system_data.last_updated = time.time()
+                    return True
                 resp.raise_for_status()
-                raw = await resp.json()
+                body = await resp.read()
+                self._last_etag = resp.headers.get("ETag")
+
+            digest = hashlib.blake2b(body, digest_size=16).digest()
+            if digest == self._last_digest:
+                self._system_data.last_updated = time.time()
+                return True
+            sd = await asyncio.to_thread(self._process_payload, body)
+            self._last_digest = digest
         except Exception as err:
-            _LOG.debug("LHM fetch failed: %s", err)
+            _LOG.debug("LHM update failed: %s", err)
+            # Start over with a full fetch and parse, so a half-read body can't pin a stale ETag or digest
+            self._last_etag = None
+            self._last_digest = None
             return False
 
-        old = self._system_data
-        sd = SystemData()
-        sd.has_dedicated_gpu = old.has_dedicated_gpu
-        sd.detected_cpu_name = old.detected_cpu_name
-        sd.detected_gpu_name = old.detected_gpu_name
+        sd.revision = next(_REVISIONS)
+        self._spare_data, self._system_data = self._system_data, sd
+        return True
+
+    def _process_payload(self, body: bytes) -> SystemData:
+        raw = orjson.loads(body)
+        current = self._system_data
+        sd = self._spare_data
+        sd.reset_measurements()
+        sd.has_dedicated_gpu = current.has_dedicated_gpu
+        sd.detected_cpu_name = current.detected_cpu_name
+        sd.detected_gpu_name = current.detected_gpu_name
+        self._sensor_index.clear()
 
         if "Children" in raw:
             if not self._logged_structure:
-                self._log_hardware_structure(raw)
+                if _LOG.isEnabledFor(logging.INFO):
+                    self._log_hardware_structure(raw)
                 self._logged_structure = True
 
-            cpu = self._detect_cpu(raw)
+            components = self._classify_components(raw)
+
+            cpu = self._detect_cpu(components)
             if cpu:
                 sd.detected_cpu_name = cpu.get("Text", "CPU")
                 self._parse_cpu(cpu, sd)
 
-            gpu = self._detect_gpu(raw)
+            gpu = self._detect_gpu(components)
             if gpu:
                 sd.detected_gpu_name = gpu.get("Text", "GPU")
                 sd.has_dedicated_gpu = True
                 self._parse_gpu(gpu, sd)
 
-            mem = self._detect_memory(raw)
+            mem = self._detect_memory(components)
             if mem:
                 self._parse_memory(mem, sd)
 
-            storage = self._detect_storage(raw)
+            storage = self._detect_storage(components)
             if storage:
                 self._parse_storage(storage, sd)
 
-            net = self._detect_network(raw)
+            net = self._detect_network(components)
             if net:
                 self._parse_network(net, sd)
 
-            mb = self._detect_motherboard(raw)
+            mb = self._detect_motherboard(components)
             if mb:
                 self._parse_motherboard(mb, sd)
 
         sd.last_updated = time.time()
-        self._system_data = sd
-        return True
+        return sd
 
     FIRE_AND_FORGET_COMMANDS = {"power_sleep", "power_hibernate", "power_shutdown", "power_restart"}
 
     async def send_command(self, command: str) -> bool:
-        if not self._session:
-            return False
-        url = f"http://{self._config.host}:{AGENT_PORT}/command"
+        if command.startswith("set_volume:"):
+            return await self._send_volume(command)
+        return await self._post_command(command)
+
+    async def _send_volume(self, command: str) -> bool:
+        """Latest value wins: a slider burst shares one sender that only posts the newest level."""
+        self._pending_volume = command
+        if self._volume_sender is None or self._volume_sender.done():
+            self._volume_sender = asyncio.create_task(self._drain_volume())
+        return await asyncio.shield(self._volume_sender)
+
+    async def _drain_volume(self) -> bool:
+        result = False
+        while self._pending_volume is not None:
+            command, self._pending_volume = self._pending_volume, None
+            result = await self._post_command(command)
+        return result
+
+    async def _post_command(self, command: str) -> bool:
+        session = self._ensure_session()
+        url = f"{self._config.agent_url}/command"
         if command in self.FIRE_AND_FORGET_COMMANDS:
             return await self._send_fire_and_forget(url, command)
         try:
-            async with self._session.post(url, json={"command": command}) as resp:
+            async with session.post(url, json={"command": command}) as resp:
                 return resp.status == 200
         except Exception as err:
             _LOG.debug("Command '%s' failed: %s", command, err)
@@ -186,7 +306,7 @@ class HTCPClient:
     async def _send_fire_and_forget(self, url: str, command: str) -> bool:
         try:
             timeout = aiohttp.ClientTimeout(total=3, connect=2)
-            async with self._session.post(url, json={"command": command}, timeout=timeout) as resp:
+            async with self._ensure_session().post(url, json={"command": command}, timeout=timeout) as resp:
                 return resp.status == 200
         except (asyncio.TimeoutError, aiohttp.ClientError):
             _LOG.info("Power command '%s' sent (host going offline as expected)", command)
@@ -196,6 +316,9 @@ class HTCPClient:
         if not self._config.wol_enabled:
             return False
         try:
+            # Only needed for Wake-on-LAN, so keep it off the startup import path
+            from wakeonlan import send_magic_packet
+
             send_magic_packet(self._config.mac_address)
             _LOG.info("WoL packet sent to %s", self._config.mac_address)
             return True
@@ -212,77 +335,114 @@ class HTCPClient:
     NETWORK_PREFIX = "/nic/"
     MOTHERBOARD_PREFIX = "/lpc/"
 
-    def _find_components(self, data: dict, prefixes: tuple[str, ...]) -> list[dict]:
-        results = []
-        for hw in data.get("Children", []):
-            for comp in hw.get("Children", []):
-                hw_id = comp.get("HardwareId", "").lower()
-                if any(hw_id.startswith(p) for p in prefixes):
-                    results.append(comp)
-                for sub in comp.get("Children", []):
-                    sub_id = sub.get("HardwareId", "").lower()
-                    if sub_id and any(sub_id.startswith(p) for p in prefixes):
-                        results.append(sub)
-        return results
-
-    def _detect_cpu(self, data: dict) -> dict | None:
-        cpus = self._find_components(data, self.CPU_PREFIXES)
-        if cpus:
-            return cpus[0]
-        for hw in data.get("Children", []):
-            for comp in hw.get("Children", []):
-                text = comp.get("Text", "").lower()
-                if any(k in text for k in ["cpu", "processor", "ryzen", "core i", "xeon"]):
-                    hw_id = comp.get("HardwareId", "").lower()
-                    if not any(hw_id.startswith(p) for p in self.GPU_PREFIXES):
-                        return comp
+    CPU_NAME_KEYWORDS = frozenset({"cpu", "processor", "ryzen", "core i", "xeon"})
+    VIRTUAL_NIC_KEYWORDS = frozenset({"vethernet", "virtual", "loopback"})
+
+    # --- Sensor name targets (lowercase, in priority order) ---
+
+    CPU_TEMP_TARGETS = ("core average", "cpu package", "package", "tctl", "tdie")
+    CPU_LOAD_TARGETS = ("cpu total", "total", "cpu usage")
+    CPU_POWER_TARGETS = ("cpu package", "package power", "cpu power", "package")
+    GPU_TEMP_TARGETS = ("gpu core", "gpu", "core", "temperature")
+    GPU_LOAD_TARGETS = ("gpu core", "gpu", "core load", "3d load")
+    MEMORY_USED_TARGETS = ("memory used", "used")
+    MEMORY_AVAILABLE_TARGETS = ("memory available", "available")
+    STORAGE_USED_TARGETS = ("used space", "usage")
+    STORAGE_TEMP_TARGETS = ("temperature",)
+    NETWORK_UP_TARGETS = ("upload speed", "tx", "sent")
+    NETWORK_DOWN_TARGETS = ("download speed", "rx", "received")
+
+    HARDWARE_PREFIXES = (
+        ("cpu", CPU_PREFIXES),
+        ("gpu", GPU_PREFIXES),
+        ("storage", STORAGE_PREFIXES),
+        ("network", (NETWORK_PREFIX,)),
+        ("motherboard", (MOTHERBOARD_PREFIX,)),
+    )
+
+    def _classify_hardware_id(self, hw_id: str) -> str | None:
+        for kind, prefixes in self.HARDWARE_PREFIXES:
+            if hw_id.startswith(prefixes):
+                return kind
         return None
 
-    def _detect_gpu(self, data: dict) -> dict | None:
-        gpus = self._find_components(data, self.GPU_PREFIXES)
-        return gpus[0] if gpus else None
+    COMPONENT_KINDS = (
+        "cpu", "cpu_by_name", "gpu", "memory", "memory_by_name", "storage", "network", "motherboard",
+    )
 
-    def _detect_memory(self, data: dict) -> dict | None:
-        for hw in data.get("Children", []):
-            for comp in hw.get("Children", []):
-                hw_id = comp.get("HardwareId", "").lower()
-                if hw_id == self.MEMORY_PREFIX or hw_id.startswith(self.MEMORY_PREFIX + "/"):
-                    return comp
+    def _classify_components(self, data: dict) -> dict[str, list[dict]]:
+        found: dict[str, list[dict]] = {kind: [] for kind in self.COMPONENT_KINDS}
         for hw in data.get("Children", []):
             for comp in hw.get("Children", []):
-                text = comp.get("Text", "").lower()
+                hw_id = (comp.get("HardwareId") or "").lower()
+                kind = self._classify_hardware_id(hw_id)
+                if kind:
+                    found[kind].append(comp)
+                elif hw_id == self.MEMORY_PREFIX or hw_id.startswith(self.MEMORY_PREFIX + "/"):
+                    found["memory"].append(comp)
+
+                text = (comp.get("Text") or "").lower()
+                if kind != "gpu" and any(k in text for k in self.CPU_NAME_KEYWORDS):
+                    found["cpu_by_name"].append(comp)
                 if "memory" in text or text == "ram":
-                    return comp
-        return None
+                    found["memory_by_name"].append(comp)
 
-    def _detect_storage(self, data: dict) -> dict | None:
+                for sub in comp.get("Children", []):
+                    sub_id = (sub.get("HardwareId") or "").lower()
+                    if sub_id:
+                        sub_kind = self._classify_hardware_id(sub_id)
+                        if sub_kind:
+                            found[sub_kind].append(sub)
+        return found
+
+    def _detect_cpu(self, components: dict[str, list[dict]]) -> dict | None:
+        cpus = components["cpu"] or components["cpu_by_name"]
+        return cpus[0] if cpus else None
+
+    def _detect_gpu(self, components: dict[str, list[dict]]) -> dict | None:
+        gpus = components["gpu"]
+        return gpus[0] if gpus else None
+
+    def _detect_memory(self, components: dict[str, list[dict]]) -> dict | None:
+        mems = components["memory"] or components["memory_by_name"]
+        return mems[0] if mems else None
+
+    def _detect_storage(self, components: dict[str, list[dict]]) -> dict | None:
         devices = []
-        for comp in self._find_components(data, self.STORAGE_PREFIXES):
-            used = self._find_sensor(comp, ["used space"], group_filter="load")
+        for comp in components["storage"]:
+            used = self._find_sensor(comp, ("used space",), group_filter="load")
             if used is not None:
                 devices.append({"component": comp, "used": used})
         if devices:
             return max(devices, key=lambda x: x["used"])["component"]
         return None
 
-    def _detect_network(self, data: dict) -> dict | None:
-        interfaces = []
-        for comp in self._find_components(data, (self.NETWORK_PREFIX,)):
-            text = comp.get("Text", "").lower()
-            if any(v in text for v in ["vethernet", "virtual", "loopback"]):
+    def _detect_network(self, components: dict[str, list[dict]]) -> dict | None:
+        fallback = None
+        best = None
+        best_activity = 0.0
+        for comp in components["network"]:
+            text = (comp.get("Text") or "").lower()
+            if any(v in text for v in self.VIRTUAL_NIC_KEYWORDS):
                 continue
-            dl = self._find_sensor(comp, ["download speed"]) or 0
-            ul = self._find_sensor(comp, ["upload speed"]) or 0
-            interfaces.append({"component": comp, "activity": dl * 10 + ul})
-        if interfaces:
-            active = [i for i in interfaces if i["activity"] > 0]
-            if active:
-                return max(active, key=lambda x: x["activity"])["component"]
-            return interfaces[0]["component"]
-        return None
-
-    def _detect_motherboard(self, data: dict) -> dict | None:
-        chips = self._find_components(data, (self.MOTHERBOARD_PREFIX,))
+            if fallback is None:
+                fallback = comp
+
+            dl = ul = None
+            for _, sensor_text, raw in self._index_sensors(comp):
+                if dl is None and "download speed" in sensor_text:
+                    dl = self._parse_value(raw)
+                elif ul is None and "upload speed" in sensor_text:
+                    ul = self._parse_value(raw)
+
+            activity = (dl or 0) * 10 + (ul or 0)
+            if activity > best_activity:
+                best = comp
+                best_activity = activity
+        return best or fallback
+
+    def _detect_motherboard(self, components: dict[str, list[dict]]) -> dict | None:
+        chips = components["motherboard"]
         return chips[0] if chips else None
 
     def _log_hardware_structure(self, data: dict) -> None:
@@ -298,133 +458,126 @@ class HTCPClient:
                         _LOG.info("  LHM sub-hardware: '%s' [%s] groups=%s", sub.get("Text", "?"), sub_id, sub_groups)
 
     def _find_sensor(
-        self, hardware: dict, targets: list[str], group_filter: str | None = None
+        self, hardware: dict, targets: tuple[str, ...], group_filter: str | None = None
     ) -> float | None:
-        for group in hardware.get("Children", []):
-            if group_filter and group_filter not in group.get("Text", "").lower():
+        return self._find_sensor_and_unit(hardware, targets, group_filter)[0]
+
+    def _index_sensors(self, hardware: dict) -> list[tuple[str, str, str]]:
+        key = id(hardware)
+        index = self._sensor_index.get(key)
+        if index is None:
+            index = []
+            for group in hardware.get("Children", []):
+                group_text = (group.get("Text") or "").lower()
+                for sensor in group.get("Children", []):
+                    value = sensor.get("Value")
+                    if value:
+                        index.append((group_text, (sensor.get("Text") or "").lower(), value))
+            self._sensor_index[key] = index
+        return index
+
+    def _find_sensor_and_unit(
+        self, hardware: dict, targets: tuple[str, ...], group_filter: str | None = None
+    ) -> tuple[float | None, str]:
+        for group_text, text, raw in self._index_sensors(hardware):
+            if group_filter and group_filter not in group_text:
                 continue
-            for sensor in group.get("Children", []):
-                text = sensor.get("Text", "").lower()
-                for target in targets:
-                    if target.lower() in text:
-                        val = self._parse_value(sensor.get("Value", ""))
-                        if val is not None:
-                            return val
-        return None
+            for target in targets:
+                if target in text:
+                    val = self._parse_value(raw)
+                    if val is not None:
+                        return val, raw
+        return None, ""
 
     @staticmethod
     def _parse_value(value_str: str) -> float | None:
-        try:
-            return float(value_str.split()[0].replace(",", "."))
-        except (ValueError, IndexError):
-            return None
+        match = _SENSOR_VALUE_RE.match(value_str)
+        if match:
+            return float(match.group(1).replace(",", "."))
+        return None
 
     def _parse_cpu(self, hw: dict, sd: SystemData) -> None:
-        sd.cpu_temp = self._find_sensor(
-            hw, ["core average", "cpu package", "package", "tctl", "tdie"], group_filter="temperature"
-        )
-        sd.cpu_load = self._find_sensor(
-            hw, ["cpu total", "total", "cpu usage"], group_filter="load"
-        )
-        sd.cpu_power = self._find_sensor(
-            hw, ["cpu package", "package power", "cpu power", "package"], group_filter="power"
-        )
-
-        clocks = []
-        for group in hw.get("Children", []):
-            if "clock" in group.get("Text", "").lower():
-                for sensor in group.get("Children", []):
-                    text = sensor.get("Text", "").lower()
-                    if ("core" in text or "cpu" in text) and "bus" not in text:
-                        val = self._parse_value(sensor.get("Value", ""))
-                        if val and val > 100:
-                            clocks.append(val)
+        sd.cpu_temp = self._find_sensor(hw, self.CPU_TEMP_TARGETS, group_filter="temperature")
+        sd.cpu_load = self._find_sensor(hw, self.CPU_LOAD_TARGETS, group_filter="load")
+        sd.cpu_power = self._find_sensor(hw, self.CPU_POWER_TARGETS, group_filter="power")
+
+        clocks = [
+            val
+            for group_text, text, raw in self._index_sensors(hw)
+            if "clock" in group_text
+            and ("core" in text or "cpu" in text)
+            and "bus" not in text
+            and (val := self._parse_value(raw))
+            and val > 100
+        ]
         if clocks:
             sd.cpu_clock = sum(clocks) / len(clocks)
 
     def _parse_gpu(self, hw: dict, sd: SystemData) -> None:
-        sd.gpu_temp = self._find_sensor(
-            hw, ["gpu core", "gpu", "core", "temperature"], group_filter="temperature"
-        )
-        sd.gpu_load = self._find_sensor(
-            hw, ["gpu core", "gpu", "core load", "3d load"], group_filter="load"
-        )
+        sd.gpu_temp = self._find_sensor(hw, self.GPU_TEMP_TARGETS, group_filter="temperature")
+        sd.gpu_load = self._find_sensor(hw, self.GPU_LOAD_TARGETS, group_filter="load")
 
     def _parse_memory(self, hw: dict, sd: SystemData) -> None:
-        used = self._find_sensor(hw, ["memory used", "used"], group_filter="data")
-        avail = self._find_sensor(hw, ["memory available", "available"], group_filter="data")
+        used = self._find_sensor(hw, self.MEMORY_USED_TARGETS, group_filter="data")
+        avail = self._find_sensor(hw, self.MEMORY_AVAILABLE_TARGETS, group_filter="data")
         if used:
             sd.memory_used = used
         if used and avail:
             sd.memory_total = used + avail
 
     def _parse_storage(self, hw: dict, sd: SystemData) -> None:
-        used_pct = self._find_sensor(hw, ["used space", "usage"], group_filter="load")
+        used_pct = self._find_sensor(hw, self.STORAGE_USED_TARGETS, group_filter="load")
         if used_pct:
             sd.storage_used_percent = used_pct
             name = hw.get("Text", "")
-            total = self._extract_size(name)
+            total = _extract_size(name)
             if total:
                 sd.storage_total = total
                 sd.storage_used = (used_pct / 100) * total
-        sd.storage_temp = self._find_sensor(hw, ["temperature"], group_filter="temperature")
+        sd.storage_temp = self._find_sensor(hw, self.STORAGE_TEMP_TARGETS, group_filter="temperature")
 
     def _parse_network(self, hw: dict, sd: SystemData) -> None:
-        ul = self._find_sensor(hw, ["upload speed", "tx", "sent"], group_filter="throughput")
-        dl = self._find_sensor(hw, ["download speed", "rx", "received"], group_filter="throughput")
+        ul, ul_raw = self._find_sensor_and_unit(hw, self.NETWORK_UP_TARGETS, group_filter="throughput")
+        dl, dl_raw = self._find_sensor_and_unit(hw, self.NETWORK_DOWN_TARGETS, group_filter="throughput")
+        sd.network_up = self._to_mbps(ul, ul_raw)
+        sd.network_down = self._to_mbps(dl, dl_raw)
 
-        def to_mbps(value: float | None, keywords: list[str]) -> float | None:
-            if value is None:
-                return None
-            for group in hw.get("Children", []):
-                for sensor in group.get("Children", []):
-                    if any(k in sensor.get("Text", "").lower() for k in keywords):
-                        v = sensor.get("Value", "")
-                        if "MB/s" in v or "Mbps" in v:
-                            return value * 8
-                        return value / 125
-            return value / 125
-
-        sd.network_up = to_mbps(ul, ["upload", "tx", "sent"])
-        sd.network_down = to_mbps(dl, ["download", "rx", "received"])
+    @staticmethod
+    def _to_mbps(value: float | None, raw: str) -> float | None:
+        if value is None:
+            return None
+        if "MB/s" in raw or "Mbps" in raw:
+            return value * 8
+        return value / 125
 
     def _parse_motherboard(self, hw: dict, sd: SystemData) -> None:
-        temps = []
+        t_sum = 0.0
+        t_cnt = 0
+        t_max = 0.0
         fans = []
         for group in hw.get("Children", []):
-            gt = group.get("Text", "").lower()
+            gt = (group.get("Text") or "").lower()
             if "temperature" in gt:
                 for s in group.get("Children", []):
-                    v = self._parse_value(s.get("Value", ""))
+                    value = s.get("Value")
+                    if not value:
+                        continue
+                    v = self._parse_value(value)
                     if v and 20 < v < 100:
-                        temps.append(v)
+                        t_sum += v
+                        t_cnt += 1
+                        if v > t_max:
+                            t_max = v
             elif "fan" in gt:
                 for s in group.get("Children", []):
-                    v = self._parse_value(s.get("Value", ""))
+                    value = s.get("Value")
+                    if not value:
+                        continue
+                    v = self._parse_value(value)
                     if v and v > 0:
                         fans.append(v)
-        if temps:
-            sd.motherboard_temp_avg = sum(temps) / len(temps)
-            sd.motherboard_temp_max = max(temps)
+        if t_cnt:
+            sd.motherboard_temp_avg = t_sum / t_cnt
+            sd.motherboard_temp_max = t_max
         if fans:
             sd.fan_speeds = fans
-
-    @staticmethod
-    def _extract_size(name: str) -> float | None:
-        match = re.search(r'(\d+(?:\.\d+)?)\s*(TB|GB)', name, re.IGNORECASE)
-        if match:
-            val = float(match.group(1))
-            if match.group(2).upper() == "TB":
-                val *= 1000
-            return val
-        return None
-
-    @staticmethod
-    def _count_sensors(data: dict) -> int:
-        count = 0
-        if isinstance(data, dict):
-            if "Value" in data and data.get("Value", "").strip():
-                count += 1
-            for child in data.get("Children", []):
-                count += HTCPClient._count_sensors(child)
-        return count
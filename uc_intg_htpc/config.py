@@ -1,13 +1,21 @@
 """
-Configuration dataclass for HTPC System Monitor integration.
+Configuration dataclass and persistence for HTPC System Monitor integration.
 
 :copyright: (c) 2026 by Meir Miyara.
 :license: MPL-2.0, see LICENSE for more details.
 """
 
-from dataclasses import dataclass, field
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any
 
-from uc_intg_htpc.const import LHM_DEFAULT_PORT
+import orjson
+from ucapi_framework import BaseConfigManager
+
+from uc_intg_htpc.const import AGENT_PORT, LHM_DEFAULT_PORT
+
+_LOG = logging.getLogger(__name__)
 
 
 @dataclass
@@ -20,14 +28,93 @@ class HTCPConfig:
     temperature_unit: str = "celsius"
     mac_address: str = ""
 
+    _DERIVED_FROM = frozenset({"host", "port", "temperature_unit"})
+
+    def __post_init__(self) -> None:
+        self._refresh_derived()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # __init__ assigns fields before __post_init__ builds the cache
+        if name in self._DERIVED_FROM and "_fahrenheit" in self.__dict__:
+            self._refresh_derived()
+
+    def _refresh_derived(self) -> None:
+        self._data_url = f"http://{self.host}:{self.port}/data.json"
+        self._agent_url = f"http://{self.host}:{AGENT_PORT}"
+        self._fahrenheit = self.temperature_unit == "fahrenheit"
+        self._temp_symbol = "°F" if self._fahrenheit else "°C"
+        self._temp_scale, self._temp_offset = (1.8, 32.0) if self._fahrenheit else (1.0, 0.0)
+
+    @property
+    def data_url(self) -> str:
+        return self._data_url
+
+    @property
+    def agent_url(self) -> str:
+        return self._agent_url
+
     @property
     def wol_enabled(self) -> bool:
         return bool(self.mac_address)
 
     def convert_temperature(self, celsius: float) -> float:
-        if self.temperature_unit == "fahrenheit":
-            return (celsius * 9 / 5) + 32
-        return celsius
+        return celsius * self._temp_scale + self._temp_offset
 
     def temperature_symbol(self) -> str:
-        return "°F" if self.temperature_unit == "fahrenheit" else "°C"
+        return self._temp_symbol
+
+    def format_temperature(self, celsius: float) -> str:
+        return f"{celsius * self._temp_scale + self._temp_offset:.1f}{self._temp_symbol}"
+
+
+class HTCPConfigManager(BaseConfigManager[HTCPConfig]):
+    """Config manager reading and writing config.json with orjson."""
+
+    @property
+    def device_count(self) -> int:
+        return len(self._config)
+
+    def load(self) -> bool:
+        try:
+            with open(self._cfg_file_path, "rb") as f:
+                data = orjson.loads(f.read())
+        except FileNotFoundError:
+            _LOG.info("Configuration file not found, starting with empty configuration: %s", self._cfg_file_path)
+            return False
+        except OSError as err:
+            _LOG.error("Cannot read the config file %s: %s", self._cfg_file_path, err)
+            return False
+        except ValueError as err:
+            _LOG.error("Invalid JSON in config file %s: %s", self._cfg_file_path, err)
+            return False
+
+        if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+            _LOG.error("Invalid config file format in %s: expected a list of devices", self._cfg_file_path)
+            return False
+
+        try:
+            devices = [device for item in data if (device := self.deserialize_device(item))]
+        except (AttributeError, ValueError, TypeError) as err:
+            _LOG.error("Invalid config file format in %s: %s", self._cfg_file_path, err)
+            return False
+
+        self._config[:] = devices
+        _LOG.info("Loaded %d device(s) from configuration", len(self._config))
+        return True
+
+    def store(self) -> bool:
+        try:
+            os.makedirs(self._data_path, exist_ok=True)
+            payload = orjson.dumps(self._config)
+            tmp_path = self._cfg_file_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._cfg_file_path)
+        except OSError as err:
+            _LOG.error("Cannot write the config file: %s", err)
+            return False
+        _LOG.debug("Stored %d device(s) to configuration file: %s", len(self._config), self._cfg_file_path)
+        return True
@@ -5,9 +5,11 @@ HTPC device implementation using PollingDevice.
 :license: MPL-2.0, see LICENSE for more details.
 """
 
-import base64
+import asyncio
 import logging
 import os
+import time
+from collections.abc import Iterable
 from typing import Any
 
 from ucapi_framework import PollingDevice
@@ -16,10 +18,62 @@ from uc_intg_htpc.client import HTCPClient, SystemData
 from uc_intg_htpc.config import HTCPConfig
 from uc_intg_htpc.const import POLL_INTERVAL
 
+try:
+    from pybase64 import b64encode
+except ImportError:
+    from binascii import b2a_base64
+
+    def b64encode(data: bytes) -> bytes:
+        return b2a_base64(data, newline=False)
+
 _LOG = logging.getLogger(__name__)
 
 MAX_CONSECUTIVE_FAILURES = 5
 RECONNECT_INTERVAL = 30
+MAX_RECONNECT_INTERVAL = 300
+# LHM fetch interval while no entity on the Remote shows the readings; still enough to notice the HTPC going away
+UNWATCHED_FETCH_INTERVAL = 60
+
+_ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
+_FALLBACK_ICON = "system_overview.png"
+
+
+def _scan_icons() -> frozenset[str]:
+    try:
+        with os.scandir(_ICON_DIR) as entries:
+            return frozenset(entry.name for entry in entries if entry.name.endswith(".png") and entry.is_file())
+    except OSError:
+        return frozenset()
+
+
+_ICONS_PRESENT = _scan_icons()
+
+# Icons never change at runtime, so every device and entity shares one copy per file
+_ICON_CACHE: dict[str, str] = {}
+# Icons asked for before load_icons() read them; each is logged once rather than on every sync
+_ICON_MISSES: set[str] = set()
+
+
+def _resolve_icon(icon_filename: str) -> str | None:
+    if icon_filename in _ICONS_PRESENT:
+        return icon_filename
+    return _FALLBACK_ICON if _FALLBACK_ICON in _ICONS_PRESENT else None
+
+
+def load_icon_data_url(icon_filename: str) -> str:
+    name = _resolve_icon(icon_filename)
+    if name is None:
+        return ""
+
+    data_url = _ICON_CACHE.get(name)
+    if data_url is None:
+        try:
+            with open(os.path.join(_ICON_DIR, name), "rb") as f:
+                data_url = f"data:image/png;base64,{b64encode(f.read()).decode('ascii')}"
+        except OSError:
+            return ""
+        _ICON_CACHE[name] = data_url
+    return data_url
 
 
 class HTCPDevice(PollingDevice):
@@ -33,8 +87,10 @@ class HTCPDevice(PollingDevice):
         self._system_data = SystemData()
         self._current_view: str = "System Overview"
         self._consecutive_failures: int = 0
-        self._reconnect_poll_count: int = 0
-        self._icon_cache: dict[str, str] = {}
+        self._reconnect_attempts: int = 0
+        self._next_reconnect: float = 0.0
+        self._next_unwatched_fetch: float = 0.0
+        self._reading_entity_ids: set[str] = set()
 
     @property
     def identifier(self) -> str:
@@ -71,28 +127,33 @@ class HTCPDevice(PollingDevice):
     def set_current_view(self, view: str) -> None:
         self._current_view = view
 
-    def get_icon_base64(self, icon_filename: str) -> str:
-        if icon_filename in self._icon_cache:
-            return self._icon_cache[icon_filename]
+    def register_reading_entity(self, entity_id: str) -> None:
+        self._reading_entity_ids.add(entity_id)
 
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        icon_path = os.path.join(script_dir, "icons", icon_filename)
+    def _readings_watched(self) -> bool:
+        driver = self.driver
+        if driver is None or not self._reading_entity_ids:
+            return True
+        configured = driver.api.configured_entities
+        return any(configured.contains(entity_id) for entity_id in self._reading_entity_ids)
 
-        if not os.path.exists(icon_path):
-            fallback = os.path.join(script_dir, "icons", "system_overview.png")
-            if os.path.exists(fallback):
-                icon_path = fallback
-            else:
-                return ""
+    async def load_icons(self, icon_filenames: Iterable[str]) -> None:
+        missing = {_resolve_icon(name) for name in icon_filenames} - _ICON_CACHE.keys() - {None}
+        if missing:
+            await asyncio.gather(*(asyncio.to_thread(load_icon_data_url, name) for name in missing))
 
-        try:
-            with open(icon_path, "rb") as f:
-                data = base64.b64encode(f.read()).decode("utf-8")
-                result = f"data:image/png;base64,{data}"
-                self._icon_cache[icon_filename] = result
-                return result
-        except Exception:
+    def get_icon_base64(self, icon_filename: str) -> str:
+        # Cache only: reading the file here would block the event loop, so callers run load_icons() first
+        name = _resolve_icon(icon_filename)
+        if name is None:
+            return ""
+        data_url = _ICON_CACHE.get(name)
+        if data_url is None:
+            if name not in _ICON_MISSES:
+                _ICON_MISSES.add(name)
+                _LOG.warning("%s Icon %s requested before it was loaded; sending no image", self.log_id, name)
             return ""
+        return data_url
 
     async def establish_connection(self) -> HTCPClient:
         self._client = HTCPClient(self._config)
@@ -104,6 +165,7 @@ class HTCPDevice(PollingDevice):
         _LOG.info("%s Connected to HTPC", self.log_id)
         self._state = "ON"
         self._consecutive_failures = 0
+        self._reconnect_attempts = 0
 
         if self._config.enable_hardware_monitoring:
             self._system_data = self._client.system_data
@@ -113,17 +175,20 @@ class HTCPDevice(PollingDevice):
 
     async def poll_device(self) -> None:
         if self._state == "UNAVAILABLE":
-            self._reconnect_poll_count += 1
-            polls_needed = RECONNECT_INTERVAL // max(POLL_INTERVAL, 1)
-            if self._reconnect_poll_count >= max(polls_needed, 3):
-                self._reconnect_poll_count = 0
-                await self._try_reconnect()
+            if time.monotonic() >= self._next_reconnect and not await self._try_reconnect():
+                self._schedule_reconnect()
             return
 
         if not self._client:
             return
 
         if self._config.enable_hardware_monitoring:
+            if not self._readings_watched():
+                now = time.monotonic()
+                if now < self._next_unwatched_fetch:
+                    self.push_update()
+                    return
+                self._next_unwatched_fetch = now + UNWATCHED_FETCH_INTERVAL
             if await self._client.update_system_data():
                 self._system_data = self._client.system_data
                 self._consecutive_failures = 0
@@ -136,12 +201,19 @@ class HTCPDevice(PollingDevice):
                 if self._consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
                     _LOG.error("%s Max failures reached, will attempt reconnection", self.log_id)
                     self._state = "UNAVAILABLE"
-                    self._reconnect_poll_count = 0
+                    self._reconnect_attempts = 0
+                    self._schedule_reconnect()
                     self.push_update()
                     return
 
         self.push_update()
 
+    def _schedule_reconnect(self) -> None:
+        delay = min(RECONNECT_INTERVAL * 2**self._reconnect_attempts, MAX_RECONNECT_INTERVAL)
+        self._reconnect_attempts += 1
+        self._next_reconnect = time.monotonic() + delay
+        _LOG.debug("%s Next reconnection attempt in %ds", self.log_id, delay)
+
     async def _try_reconnect(self) -> bool:
         _LOG.info("%s Attempting reconnection", self.log_id)
         if self._client:
@@ -166,9 +238,14 @@ class HTCPDevice(PollingDevice):
 
     async def power_on_wol(self) -> bool:
         if self._client:
-            return await self._client.power_on_wol()
-        temp_client = HTCPClient(self._config)
-        return await temp_client.power_on_wol()
+            sent = await self._client.power_on_wol()
+        else:
+            sent = await HTCPClient(self._config).power_on_wol()
+        if sent and self._state == "UNAVAILABLE":
+            # The PC is expected back shortly, so don't sit out a long backoff delay
+            self._reconnect_attempts = 0
+            self._next_reconnect = time.monotonic() + RECONNECT_INTERVAL
+        return sent
 
     async def disconnect(self) -> None:
         if self._client:
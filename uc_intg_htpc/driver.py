@@ -5,6 +5,7 @@ HTPC integration driver.
 :license: MPL-2.0, see LICENSE for more details.
 """
 
+import asyncio
 import logging
 
 from ucapi_framework import BaseIntegrationDriver
@@ -31,3 +32,10 @@ class HTCPDriver(BaseIntegrationDriver[HTCPDevice, HTCPConfig]):
             ],
             driver_id="uc-intg-htpc",
         )
+
+    async def shutdown(self) -> None:
+        devices = list(self._device_instances.values())
+        results = await asyncio.gather(*(device.disconnect() for device in devices), return_exceptions=True)
+        for device, result in zip(devices, results):
+            if isinstance(result, Exception):
+                _LOG.warning("%s Error while disconnecting: %s", device.log_id, result)
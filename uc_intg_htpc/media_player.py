@@ -6,11 +6,13 @@ HTPC media player entity for system monitoring display.
 """
 
 import logging
+from operator import attrgetter
 from typing import Any
 
 from ucapi import StatusCodes, media_player
 from ucapi_framework import MediaPlayerEntity
 
+from uc_intg_htpc.client import SystemData
 from uc_intg_htpc.config import HTCPConfig
 from uc_intg_htpc.const import MONITORING_VIEWS
 from uc_intg_htpc.device import HTCPDevice
@@ -29,6 +31,164 @@ SOURCE_ICONS = {
     "Power Consumption": "power_consumption.png",
 }
 
+_TITLE = media_player.Attributes.MEDIA_TITLE
+_ARTIST = media_player.Attributes.MEDIA_ARTIST
+_ALBUM = media_player.Attributes.MEDIA_ALBUM
+
+# Fixed texts for views without data; sync_state only reads them
+_NO_GPU = {
+    _TITLE: "No Dedicated GPU",
+    _ARTIST: "Using Integrated Graphics",
+    _ALBUM: "",
+}
+_NO_FANS = {
+    _TITLE: "No Fan Data",
+    _ARTIST: "Fans not detected",
+    _ALBUM: "",
+}
+_NO_POWER = {
+    _TITLE: "Power Monitoring",
+    _ARTIST: "No power sensors detected",
+    _ALBUM: "",
+}
+
+# Every displayed reading; fan_speeds is compared separately as a tuple
+_READINGS = attrgetter(*(f for f in SystemData.__slots__ if f not in ("fan_speeds", "last_updated", "revision")))
+
+
+def _fmt_temp(val: float | None, cfg: HTCPConfig) -> str:
+    return cfg.format_temperature(val) if val is not None else "N/A"
+
+
+def _fmt_pct(val: float | None) -> str:
+    return f"{val:.1f}%" if val is not None else "N/A"
+
+
+def _fmt_speed(val: float | None) -> str:
+    if val is None:
+        return "N/A"
+    if val > 1000:
+        return f"{val / 1000:.2f} Gbps"
+    return f"{val:.1f} Mbps"
+
+
+def _format_system_overview(data: SystemData, cfg: HTCPConfig) -> dict[str, Any]:
+    cpu_power = data.cpu_power
+    used, total = data.memory_used, data.memory_total
+    power = f"Power: {cpu_power:.1f}W" if cpu_power else "Power: N/A"
+    mem = "N/A"
+    if used is not None and total:
+        mem = f"{used:.1f}/{total:.1f} GB ({used / total * 100:.1f}%)"
+    title = f"CPU: {_fmt_temp(data.cpu_temp, cfg)} ({_fmt_pct(data.cpu_load)})"
+    return {
+        _TITLE: title,
+        _ARTIST: power,
+        _ALBUM: mem,
+    }
+
+
+def _format_cpu(data: SystemData, cfg: HTCPConfig) -> dict[str, Any]:
+    return {
+        _TITLE: f"Temperature: {_fmt_temp(data.cpu_temp, cfg)}",
+        _ARTIST: f"Load: {_fmt_pct(data.cpu_load)}",
+        _ALBUM: f"Clock: {data.cpu_clock or 0:.0f} MHz",
+    }
+
+
+def _format_gpu(data: SystemData, cfg: HTCPConfig) -> dict[str, Any]:
+    if data.gpu_temp is not None or data.gpu_load is not None:
+        return {
+            _TITLE: f"Temperature: {_fmt_temp(data.gpu_temp, cfg)}",
+            _ARTIST: f"Load: {_fmt_pct(data.gpu_load)}",
+            _ALBUM: "Dedicated Graphics",
+        }
+    return _NO_GPU
+
+
+def _format_memory(data: SystemData, cfg: HTCPConfig) -> dict[str, Any]:
+    used = data.memory_used or 0
+    total = data.memory_total or 0
+    pct = used / (total or 1) * 100
+    return {
+        _TITLE: f"Used: {used:.1f} GB",
+        _ARTIST: f"Total: {total:.1f} GB",
+        _ALBUM: f"Usage: {pct:.1f}%",
+    }
+
+
+def _format_storage(data: SystemData, cfg: HTCPConfig) -> dict[str, Any]:
+    used, total = data.storage_used, data.storage_total
+    usage = f"Usage: {data.storage_used_percent or 0:.1f}%"
+    if total and used:
+        return {
+            _TITLE: f"Used: {used:.1f} GB",
+            _ARTIST: f"Total: {total:.1f} GB",
+            _ALBUM: usage,
+        }
+    return {
+        _TITLE: usage,
+        _ARTIST: "Primary Drive",
+        _ALBUM: "",
+    }
+
+
+def _format_network(data: SystemData, cfg: HTCPConfig) -> dict[str, Any]:
+    return {
+        _TITLE: f"Download: {_fmt_speed(data.network_down)}",
+        _ARTIST: f"Upload: {_fmt_speed(data.network_up)}",
+        _ALBUM: "Active Interface",
+    }
+
+
+def _format_temperatures(data: SystemData, cfg: HTCPConfig) -> dict[str, Any]:
+    return {
+        _TITLE: f"CPU: {_fmt_temp(data.cpu_temp, cfg)}",
+        _ARTIST: f"Storage: {_fmt_temp(data.storage_temp, cfg)}",
+        _ALBUM: f"Motherboard: {_fmt_temp(data.motherboard_temp_avg, cfg)}",
+    }
+
+
+def _format_fans(data: SystemData, cfg: HTCPConfig) -> dict[str, Any]:
+    count = 0
+    total = peak = 0.0
+    for rpm in data.fan_speeds:
+        count += 1
+        total += rpm
+        if rpm > peak:
+            peak = rpm
+    if count:
+        return {
+            _TITLE: f"Active Fans: {count}",
+            _ARTIST: f"Average: {total / count:.0f} RPM",
+            _ALBUM: f"Maximum: {peak:.0f} RPM",
+        }
+    return _NO_FANS
+
+
+def _format_power(data: SystemData, cfg: HTCPConfig) -> dict[str, Any]:
+    cpu_power = data.cpu_power
+    if cpu_power:
+        return {
+            _TITLE: f"CPU Package: {cpu_power:.1f}W",
+            _ARTIST: "Real-time Power Draw",
+            _ALBUM: "",
+        }
+    return _NO_POWER
+
+
+_VIEW_FORMATTERS = {
+    "System Overview": _format_system_overview,
+    "CPU Performance": _format_cpu,
+    "GPU Performance": _format_gpu,
+    "Memory Usage": _format_memory,
+    "Storage Activity": _format_storage,
+    "Network Activity": _format_network,
+    "Temperature Overview": _format_temperatures,
+    "Fan Monitoring": _format_fans,
+    "Power Consumption": _format_power,
+}
+
+
 FEATURES = [
     media_player.Features.ON_OFF,
     media_player.Features.SELECT_SOURCE,
@@ -64,141 +224,67 @@ class HTCPMediaPlayer(MediaPlayerEntity):
             },
             cmd_handler=self._handle_command,
         )
+        self._last_revision: tuple | None = None
+        self._last_signature: tuple | None = None
+        self._image_view: str | None = None
+        self._source_images: dict[str, str] = {}
+        device.register_reading_entity(entity_id)
         self.subscribe_to_device(device)
 
     async def sync_state(self) -> None:
         if self._device.state == "UNAVAILABLE":
             self.update({
                 media_player.Attributes.STATE: media_player.States.UNAVAILABLE,
-                media_player.Attributes.MEDIA_TITLE: "Connection Lost",
-                media_player.Attributes.MEDIA_ARTIST: "Attempting reconnection...",
-                media_player.Attributes.MEDIA_ALBUM: "",
+                _TITLE: "Connection Lost",
+                _ARTIST: "Attempting reconnection...",
+                _ALBUM: "",
             })
+            self._last_revision = None
+            self._last_signature = None
+            self._image_view = None
             return
 
+        if not self._source_images:
+            await self._device.load_icons(SOURCE_ICONS.values())
+            self._source_images = {
+                view: self._device.get_icon_base64(icon) for view, icon in SOURCE_ICONS.items()
+            }
+
         data = self._device.system_data
         view = self._device.current_view
-        icon_file = SOURCE_ICONS.get(view, "system_overview.png")
+        symbol = self._device.config.temperature_symbol()
+        # Same payload revision means nothing to re-render; a new one still may read the same
+        revision = (view, symbol, data.revision)
+        if revision == self._last_revision:
+            return
+        self._last_revision = revision
+        signature = (view, symbol, _READINGS(data), tuple(data.fan_speeds))
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
 
         attrs: dict[str, Any] = {
             media_player.Attributes.STATE: media_player.States.ON,
-            media_player.Attributes.SOURCE_LIST: MONITORING_VIEWS,
             media_player.Attributes.SOURCE: view,
-            media_player.Attributes.MEDIA_IMAGE_URL: self._device.get_icon_base64(icon_file),
         }
+        # The icon only follows the source, so skip the data URL on plain reading updates
+        if view != self._image_view:
+            attrs[media_player.Attributes.MEDIA_IMAGE_URL] = (
+                self._source_images.get(view) or self._source_images["System Overview"]
+            )
+            self._image_view = view
         attrs.update(self._format_view_data(view, data))
         self.update(attrs)
 
-    def _format_view_data(self, view: str, data: Any) -> dict[str, Any]:
-        cfg = self._device.config
-
-        def fmt_temp(val: float | None) -> str:
-            if val is None:
-                return "N/A"
-            return f"{cfg.convert_temperature(val):.1f}{cfg.temperature_symbol()}"
-
-        def fmt_pct(val: float | None) -> str:
-            return f"{val:.1f}%" if val is not None else "N/A"
-
-        def fmt_speed(val: float | None) -> str:
-            if val is None:
-                return "N/A"
-            if val > 1000:
-                return f"{val / 1000:.2f} Gbps"
-            return f"{val:.1f} Mbps"
-
-        match view:
-            case "System Overview":
-                power = f"Power: {data.cpu_power:.1f}W" if data.cpu_power else "Power: N/A"
-                mem = "N/A"
-                if data.memory_used is not None and data.memory_total:
-                    pct = (data.memory_used / data.memory_total) * 100
-                    mem = f"{data.memory_used:.1f}/{data.memory_total:.1f} GB ({pct:.1f}%)"
-                return {
-                    media_player.Attributes.MEDIA_TITLE: f"CPU: {fmt_temp(data.cpu_temp)} ({fmt_pct(data.cpu_load)})",
-                    media_player.Attributes.MEDIA_ARTIST: power,
-                    media_player.Attributes.MEDIA_ALBUM: mem,
-                }
-            case "CPU Performance":
-                return {
-                    media_player.Attributes.MEDIA_TITLE: f"Temperature: {fmt_temp(data.cpu_temp)}",
-                    media_player.Attributes.MEDIA_ARTIST: f"Load: {fmt_pct(data.cpu_load)}",
-                    media_player.Attributes.MEDIA_ALBUM: f"Clock: {data.cpu_clock or 0:.0f} MHz",
-                }
-            case "GPU Performance":
-                if data.gpu_temp is not None or data.gpu_load is not None:
-                    return {
-                        media_player.Attributes.MEDIA_TITLE: f"Temperature: {fmt_temp(data.gpu_temp)}",
-                        media_player.Attributes.MEDIA_ARTIST: f"Load: {fmt_pct(data.gpu_load)}",
-                        media_player.Attributes.MEDIA_ALBUM: "Dedicated Graphics",
-                    }
-                return {
-                    media_player.Attributes.MEDIA_TITLE: "No Dedicated GPU",
-                    media_player.Attributes.MEDIA_ARTIST: "Using Integrated Graphics",
-                    media_player.Attributes.MEDIA_ALBUM: "",
-                }
-            case "Memory Usage":
-                pct = ((data.memory_used or 0) / (data.memory_total or 1)) * 100
-                return {
-                    media_player.Attributes.MEDIA_TITLE: f"Used: {data.memory_used or 0:.1f} GB",
-                    media_player.Attributes.MEDIA_ARTIST: f"Total: {data.memory_total or 0:.1f} GB",
-                    media_player.Attributes.MEDIA_ALBUM: f"Usage: {pct:.1f}%",
-                }
-            case "Storage Activity":
-                if data.storage_total and data.storage_used:
-                    return {
-                        media_player.Attributes.MEDIA_TITLE: f"Used: {data.storage_used:.1f} GB",
-                        media_player.Attributes.MEDIA_ARTIST: f"Total: {data.storage_total:.1f} GB",
-                        media_player.Attributes.MEDIA_ALBUM: f"Usage: {data.storage_used_percent or 0:.1f}%",
-                    }
-                return {
-                    media_player.Attributes.MEDIA_TITLE: f"Usage: {data.storage_used_percent or 0:.1f}%",
-                    media_player.Attributes.MEDIA_ARTIST: "Primary Drive",
-                    media_player.Attributes.MEDIA_ALBUM: "",
-                }
-            case "Network Activity":
-                return {
-                    media_player.Attributes.MEDIA_TITLE: f"Download: {fmt_speed(data.network_down)}",
-                    media_player.Attributes.MEDIA_ARTIST: f"Upload: {fmt_speed(data.network_up)}",
-                    media_player.Attributes.MEDIA_ALBUM: "Active Interface",
-                }
-            case "Temperature Overview":
-                return {
-                    media_player.Attributes.MEDIA_TITLE: f"CPU: {fmt_temp(data.cpu_temp)}",
-                    media_player.Attributes.MEDIA_ARTIST: f"Storage: {fmt_temp(data.storage_temp)}",
-                    media_player.Attributes.MEDIA_ALBUM: f"Motherboard: {fmt_temp(data.motherboard_temp_avg)}",
-                }
-            case "Fan Monitoring":
-                if data.fan_speeds:
-                    avg = sum(data.fan_speeds) / len(data.fan_speeds)
-                    return {
-                        media_player.Attributes.MEDIA_TITLE: f"Active Fans: {len(data.fan_speeds)}",
-                        media_player.Attributes.MEDIA_ARTIST: f"Average: {avg:.0f} RPM",
-                        media_player.Attributes.MEDIA_ALBUM: f"Maximum: {max(data.fan_speeds):.0f} RPM",
-                    }
-                return {
-                    media_player.Attributes.MEDIA_TITLE: "No Fan Data",
-                    media_player.Attributes.MEDIA_ARTIST: "Fans not detected",
-                    media_player.Attributes.MEDIA_ALBUM: "",
-                }
-            case "Power Consumption":
-                if data.cpu_power:
-                    return {
-                        media_player.Attributes.MEDIA_TITLE: f"CPU Package: {data.cpu_power:.1f}W",
-                        media_player.Attributes.MEDIA_ARTIST: "Real-time Power Draw",
-                        media_player.Attributes.MEDIA_ALBUM: "",
-                    }
-                return {
-                    media_player.Attributes.MEDIA_TITLE: "Power Monitoring",
-                    media_player.Attributes.MEDIA_ARTIST: "No power sensors detected",
-                    media_player.Attributes.MEDIA_ALBUM: "",
-                }
-            case _:
-                return {
-                    media_player.Attributes.MEDIA_TITLE: view,
-                    media_player.Attributes.MEDIA_ARTIST: "",
-                    media_player.Attributes.MEDIA_ALBUM: "",
-                }
+    def _format_view_data(self, view: str, data: SystemData) -> dict[str, Any]:
+        formatter = _VIEW_FORMATTERS.get(view)
+        if formatter is None:
+            return {
+                _TITLE: view,
+                _ARTIST: "",
+                _ALBUM: "",
+            }
+        return formatter(data, self._device.config)
 
     async def _handle_command(
         self, entity: Any, cmd_id: str, params: dict[str, Any] | None
@@ -23,6 +23,24 @@ COMMAND_MAP = {
 }
 
 
+_SIMPLE_COMMANDS = (
+    "POWER_OFF",
+    "arrow_up", "arrow_down", "arrow_left", "arrow_right", "enter", "escape",
+    "back", "home", "end", "page_up", "page_down", "tab", "space", "delete",
+    "backspace",
+    "play_pause", "play", "pause", "stop", "previous", "next", "fast_forward",
+    "rewind", "record", "volume_up", "volume_down", "mute",
+    "f1", "f2", "f3", "f4", "f5", "f6", "f7", "f8", "f9", "f10", "f11", "f12",
+    "windows_key", "alt_tab", "win_r", "win_d", "win_e", "win_i",
+    "ctrl_shift_esc",
+    "custom_calc", "custom_notepad", "custom_cmd", "custom_powershell",
+    "url_youtube", "url_netflix", "url_plex", "url_jellyfin",
+    "power_sleep", "power_hibernate", "power_shutdown", "power_restart",
+    "pair_bluetooth", "show_pairing_help",
+)
+_SIMPLE_COMMANDS_WOL = ("POWER_ON", *_SIMPLE_COMMANDS)
+
+
 class HTCPRemote(RemoteEntity):
     """Remote entity for HTPC control with UI pages."""
 
@@ -31,33 +49,9 @@ class HTCPRemote(RemoteEntity):
         self._config = device_config
         entity_id = f"remote.{device_config.identifier}"
 
-        simple_commands = [
-            "POWER_OFF",
-            "arrow_up", "arrow_down", "arrow_left", "arrow_right", "enter", "escape",
-            "back", "home", "end", "page_up", "page_down", "tab", "space", "delete",
-            "backspace",
-            "play_pause", "play", "pause", "stop", "previous", "next", "fast_forward",
-            "rewind", "record", "volume_up", "volume_down", "mute",
-            "f1", "f2", "f3", "f4", "f5", "f6", "f7", "f8", "f9", "f10", "f11", "f12",
-            "windows_key", "alt_tab", "win_r", "win_d", "win_e", "win_i",
-            "ctrl_shift_esc",
-            "custom_calc", "custom_notepad", "custom_cmd", "custom_powershell",
-            "url_youtube", "url_netflix", "url_plex", "url_jellyfin",
-            "power_sleep", "power_hibernate", "power_shutdown", "power_restart",
-            "pair_bluetooth", "show_pairing_help",
-        ]
-
-        if device_config.wol_enabled:
-            simple_commands.insert(0, "POWER_ON")
-
-        pages = [
-            _create_navigation_page(),
-            _create_media_page(),
-            _create_windows_shortcuts_page(),
-            _create_system_tools_page(),
-            _create_function_keys_page(),
-            _create_power_system_page(device_config.wol_enabled),
-        ]
+        simple_commands = _SIMPLE_COMMANDS_WOL if device_config.wol_enabled else _SIMPLE_COMMANDS
+
+        pages = [*_STATIC_PAGES, _POWER_PAGES[device_config.wol_enabled]]
 
         super().__init__(
             entity_id,
@@ -232,3 +226,14 @@ def _create_power_system_page(wol_enabled: bool) -> UiPage:
         create_ui_text("Desktop", 3, 1, cmd="win_d"),
     ])
     return page
+
+
+# Pages are serialized into the entity options, so one build per module is shared by every remote
+_STATIC_PAGES = (
+    _create_navigation_page(),
+    _create_media_page(),
+    _create_windows_shortcuts_page(),
+    _create_system_tools_page(),
+    _create_function_keys_page(),
+)
+_POWER_PAGES = {wol: _create_power_system_page(wol) for wol in (False, True)}
@@ -41,6 +41,7 @@ class HTCPSensor(SensorEntity):
             },
             device_class=device_class,
         )
+        device.register_reading_entity(entity_id)
         self.subscribe_to_device(device)
 
     async def sync_state(self) -> None:
@@ -5,10 +5,11 @@ HTPC setup flow for device configuration.
 :license: MPL-2.0, see LICENSE for more details.
 """
 
+import asyncio
 import logging
 from typing import Any
 
-from ucapi import RequestUserInput
+from ucapi import RequestUserInput, SetupError
 from ucapi_framework import BaseSetupFlow
 
 from uc_intg_htpc.client import HTCPClient
@@ -76,7 +77,7 @@ class HTCPSetupFlow(BaseSetupFlow[HTCPConfig]):
 
     async def query_device(
         self, input_values: dict[str, Any]
-    ) -> HTCPConfig | RequestUserInput:
+    ) -> HTCPConfig | SetupError | RequestUserInput:
         host = input_values.get("host", "").strip()
         if not host:
             raise ValueError("HTPC IP address is required")
@@ -97,16 +98,19 @@ class HTCPSetupFlow(BaseSetupFlow[HTCPConfig]):
 
         client = HTCPClient(config)
         try:
+            # The two probes hit different ports and don't depend on each other
             if enable_hw:
-                result = await client.test_lhm()
+                result, agent_ok = await asyncio.gather(client.test_lhm(), client.test_agent())
                 if not result["success"]:
-                    raise ValueError(
-                        f"Cannot connect to LibreHardwareMonitor at {host}:{config.port}: "
-                        f"{result.get('error', 'Unknown error')}"
+                    _LOG.error(
+                        "Cannot connect to LibreHardwareMonitor at %s:%s: %s",
+                        host, config.port, result.get("error", "Unknown error"),
                     )
+                    return SetupError(error_type=result["error_code"])
                 _LOG.info("LHM connection test passed with %d sensors", result.get("sensor_count", 0))
+            else:
+                agent_ok = await client.test_agent()
 
-            agent_ok = await client.test_agent()
             if agent_ok:
                 _LOG.info("HTPC Agent is reachable")
             else: